@@ -5,27 +5,119 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
-from datetime import datetime
+import stat
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
 INDEX_DIR = DATA_DIR / "index"
 REPORT_DIR = DATA_DIR / "reports"
 CONF_DIR = PROJECT_ROOT / "conf"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "wagstaff"
+
+# Above this size JSON is parsed straight from a read-only mapping instead of a heap copy.
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _orjson_load(path: Path) -> Any:
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(fh.read())
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
+def as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else []
 
 
 def read_json(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
+    if orjson is not None:
+        try:
+            return _orjson_load(path)
+        except Exception:
+            pass
     try:
         return json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return None
 
 
+def write_json_atomic(path: Path, doc: Any) -> None:
+    """Stream *doc* into a unique sibling temp file, then swap it in with os.replace.
+
+    Concurrent writers never share a temp file, and a failed write leaves no stray temp behind.
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            payload = None
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        if payload is not None:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(doc, fh, ensure_ascii=False, indent=2)
+        # mkstemp creates 0600; keep the target's permissions (or the usual 0644).
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def keyed_json_cache(path: Path, key: Any, compute: Callable[[], Any]) -> Any:
+    """Value cached in *path* under *key*; otherwise `compute()` it and store it.
+
+    A None *key* disables caching. Exceptions from *compute* propagate and nothing
+    is stored; a failed cache write is ignored.
+    """
+    if key is None:
+        return compute()
+    doc = as_dict(read_json(path))
+    if doc.get("key") == key and "value" in doc:
+        return doc["value"]
+    value = compute()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(path, {"key": key, "value": value})
+    except OSError:
+        pass
+    return value
+
+
 def read_text(path: Path) -> Optional[str]:
     if not path.exists():
         return None
@@ -35,35 +127,103 @@ def read_text(path: Path) -> Optional[str]:
         return None
 
 
+STATUS_PATH = PROJECT_ROOT / "PROJECT_STATUS.json"
+_STATUS_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
 def load_status() -> Dict[str, Any]:
-    status_path = PROJECT_ROOT / "PROJECT_STATUS.json"
-    doc = read_json(status_path)
-    return doc if isinstance(doc, dict) else {}
+    """Parsed PROJECT_STATUS.json, cached by (path, mtime_ns, size).
+
+    The returned dict is shared between callers; copy it before mutating.
+    """
+    try:
+        st = os.stat(STATUS_PATH)
+    except OSError:
+        return {}
+    key = (str(STATUS_PATH), st.st_mtime_ns, st.st_size)
+    cached = _STATUS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    doc = as_dict(read_json(STATUS_PATH))
+    _STATUS_CACHE.clear()
+    _STATUS_CACHE[key] = doc
+    return doc
+
+
+@lru_cache(maxsize=512)
+def _file_info_cached(path: str, follow_symlinks: bool) -> Tuple[bool, int, Optional[float]]:
+    try:
+        st = os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        return False, 0, None
+    return True, int(st.st_size), float(st.st_mtime)
 
 
-def file_info(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {"exists": False, "size": 0, "mtime": None}
-    st = path.stat()
-    return {"exists": True, "size": int(st.st_size), "mtime": float(st.st_mtime)}
+def file_info(path: Path, follow_symlinks: bool = False) -> Dict[str, Any]:
+    """Return size/mtime for *path*; memoized per process (CLI runs are short-lived).
+
+    Artifacts and docs are regular files, so symlinks are not followed unless asked.
+    Each call gets its own dict; only the immutable stat tuple is shared.
+    """
+    exists, size, mtime = _file_info_cached(str(path), follow_symlinks)
+    return {"exists": exists, "size": size, "mtime": mtime}
 
 
+def file_row(path: Path, root: Path = PROJECT_ROOT) -> Tuple[bool, str, str, str]:
+    """(exists, mtime, size, root-relative path) display cells for one file."""
+    info = file_info(path)
+    root_prefix = str(root) + os.sep
+    text = str(path)
+    rel = text[len(root_prefix):] if text.startswith(root_prefix) else text
+    return info["exists"], human_mtime(info["mtime"]), human_size(info["size"]), rel
+
+
+def scan_dir_info(
+    dir_path: Path, names: Iterable[str], follow_symlinks: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Bulk ``file_info`` for several names in one directory via a single scandir pass."""
+    try:
+        with os.scandir(dir_path) as it:
+            entries = {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        entries = {}
+    out: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        entry = entries.get(name)
+        if entry is None:
+            out[name] = {"exists": False, "size": 0, "mtime": None}
+            continue
+        try:
+            st = entry.stat(follow_symlinks=follow_symlinks)
+        except (FileNotFoundError, NotADirectoryError):
+            out[name] = {"exists": False, "size": 0, "mtime": None}
+            continue
+        out[name] = {"exists": True, "size": int(st.st_size), "mtime": float(st.st_mtime)}
+    return out
+
+
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
+@lru_cache(maxsize=256)
 def human_size(num: int) -> str:
     if num <= 0:
         return "-"
-    for unit in ("B", "KiB", "MiB", "GiB"):
-        if num < 1024.0:
-            return f"{num:.0f} {unit}" if unit == "B" else f"{num:.1f} {unit}"
-        num /= 1024.0
-    return f"{num:.1f} TiB"
+    if num < 1024:
+        return f"{num:.0f} B"
+    # Unit thresholds are powers of two, so the integer part picks the same unit for floats.
+    idx = min(int(num).bit_length() - 1, 49) // 10
+    return f"{num / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
+@lru_cache(maxsize=256)
 def human_mtime(ts: Optional[float]) -> str:
     if not ts:
         return "-"
-    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
 
 
+@lru_cache(maxsize=1)
 def env_hint() -> Tuple[str, str]:
     env = os.environ.get("CONDA_DEFAULT_ENV", "").strip()
     if env:
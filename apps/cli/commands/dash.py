@@ -2,17 +2,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-from rich import box
-from rich.align import Align
-from rich.columns import Columns
-from rich.console import Console, Group
-from rich.panel import Panel
-from rich.rule import Rule
-from rich.table import Table
-from rich.text import Text
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from apps.cli.cli_common import (
     CONF_DIR,
@@ -20,16 +14,23 @@ from apps.cli.cli_common import (
     INDEX_DIR,
     REPORT_DIR,
     PROJECT_ROOT,
+    as_dict,
+    as_list,
     env_hint,
     file_info,
     human_mtime,
     load_status,
     read_json,
+    scan_dir_info,
 )
-from core.version import project_version
 from apps.cli.registry import get_tools
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# Rich is imported lazily inside the render helpers to keep module import cheap.
 
 PALETTE = {
     "accent": "cyan",
@@ -41,24 +42,74 @@ PALETTE = {
 }
 
 
-def _artifact_rows() -> List[Tuple[str, Path]]:
-    return [
-        ("resource_index", INDEX_DIR / "wagstaff_resource_index_v1.json"),
-        ("catalog_v2", INDEX_DIR / "wagstaff_catalog_v2.json"),
-        ("catalog_sqlite", INDEX_DIR / "wagstaff_catalog_v2.sqlite"),
-        ("catalog_index", INDEX_DIR / "wagstaff_catalog_index_v1.json"),
-        ("icon_index", INDEX_DIR / "wagstaff_icon_index_v1.json"),
-        ("i18n_index", INDEX_DIR / "wagstaff_i18n_v1.json"),
-        ("tuning_trace", INDEX_DIR / "wagstaff_tuning_trace_v1.json"),
-        ("farming_defs", INDEX_DIR / "wagstaff_farming_defs_v1.json"),
-        ("mechanism_index", INDEX_DIR / "wagstaff_mechanism_index_v1.json"),
-        ("mechanism_sqlite", INDEX_DIR / "wagstaff_mechanism_index_v1.sqlite"),
-        ("behavior_graph", INDEX_DIR / "wagstaff_behavior_graph_v1.json"),
-        ("index_manifest", INDEX_DIR / "wagstaff_index_manifest.json"),
-    ]
+_ROOT_PREFIX = str(PROJECT_ROOT) + os.sep
+
+
+def _rel(path: Path) -> str:
+    text = str(path)
+    return text[len(_ROOT_PREFIX):] if text.startswith(_ROOT_PREFIX) else text
+
+
+_ARTIFACT_ROWS: Tuple[Tuple[str, Path], ...] = (
+    ("resource_index", INDEX_DIR / "wagstaff_resource_index_v1.json"),
+    ("catalog_v2", INDEX_DIR / "wagstaff_catalog_v2.json"),
+    ("catalog_sqlite", INDEX_DIR / "wagstaff_catalog_v2.sqlite"),
+    ("catalog_index", INDEX_DIR / "wagstaff_catalog_index_v1.json"),
+    ("icon_index", INDEX_DIR / "wagstaff_icon_index_v1.json"),
+    ("i18n_index", INDEX_DIR / "wagstaff_i18n_v1.json"),
+    ("tuning_trace", INDEX_DIR / "wagstaff_tuning_trace_v1.json"),
+    ("farming_defs", INDEX_DIR / "wagstaff_farming_defs_v1.json"),
+    ("mechanism_index", INDEX_DIR / "wagstaff_mechanism_index_v1.json"),
+    ("mechanism_sqlite", INDEX_DIR / "wagstaff_mechanism_index_v1.sqlite"),
+    ("behavior_graph", INDEX_DIR / "wagstaff_behavior_graph_v1.json"),
+    ("index_manifest", INDEX_DIR / "wagstaff_index_manifest.json"),
+)
+
+_DOC_ROWS: Tuple[Tuple[str, Path, str], ...] = tuple(
+    (name, path, _rel(path))
+    for name, path in (
+        ("DEV_GUIDE", PROJECT_ROOT / "docs" / "guides" / "DEV_GUIDE.md"),
+        ("CLI_GUIDE", PROJECT_ROOT / "docs" / "guides" / "CLI_GUIDE.md"),
+        ("PROJECT_MANAGEMENT", PROJECT_ROOT / "docs" / "management" / "PROJECT_MANAGEMENT.md"),
+        ("CATALOG_V2_SPEC", PROJECT_ROOT / "docs" / "specs" / "CATALOG_V2_SPEC.md"),
+        ("MECHANISM_INDEX_SPEC", PROJECT_ROOT / "docs" / "specs" / "MECHANISM_INDEX_SPEC.md"),
+        ("SQLITE_V4_SPEC", PROJECT_ROOT / "docs" / "specs" / "SQLITE_V4_SPEC.md"),
+        ("ROADMAP", PROJECT_ROOT / "docs" / "management" / "ROADMAP.md"),
+    )
+)
+
+_INDEX_MANIFEST = INDEX_DIR / "wagstaff_index_manifest.json"
+_REPORT_MANIFEST = REPORT_DIR / "wagstaff_report_manifest.json"
+_REPORT_HUB = REPORT_DIR / "index.html"
+_PORTAL_HUB = REPORT_DIR / "portal_index.html"
+
+# Display paths never change within a run; resolve them once at import.
+_REL_PATHS: Dict[Path, str] = {
+    path: _rel(path)
+    for path in (_INDEX_MANIFEST, _REPORT_MANIFEST, _REPORT_HUB, _PORTAL_HUB)
+}
+
+
+def _infos_by_path(paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+    by_dir: Dict[Path, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(path.parent, []).append(path.name)
+    out: Dict[Path, Dict[str, Any]] = {}
+    for parent, names in by_dir.items():
+        for name, info in scan_dir_info(parent, names).items():
+            out[parent / name] = info
+    return out
+
+
+def _version_field(doc: Any, key: str) -> str:
+    val = as_dict(doc).get(key)
+    return val.strip() if isinstance(val, str) else ""
 
 
 def _panel(title: str, body: Any, *, border: str = "cyan") -> Panel:
+    from rich import box
+    from rich.panel import Panel
+
     return Panel(
         body,
         title=title,
@@ -70,6 +121,8 @@ def _panel(title: str, body: Any, *, border: str = "cyan") -> Panel:
 
 
 def _kv_table(rows: List[Tuple[str, Any]]) -> Table:
+    from rich.table import Table
+
     table = Table.grid(padding=(0, 1))
     table.add_column(justify="right", style="bold", no_wrap=True)
     table.add_column(ratio=1)
@@ -78,7 +131,10 @@ def _kv_table(rows: List[Tuple[str, Any]]) -> Table:
     return table
 
 
+@lru_cache(maxsize=None)
 def _badge(label: str, level: str) -> Text:
+    from rich.text import Text
+
     color = PALETTE.get(level, "white")
     return Text(label, style=f"bold {color}")
 
@@ -90,6 +146,8 @@ def _ratio(value: Any) -> str:
 
 
 def _bullets(items: List[str], limit: int) -> Text:
+    from rich.text import Text
+
     if not items:
         return Text("-", style=f"dim {PALETTE['muted']}")
     trimmed = items[:limit] if limit > 0 else items
@@ -97,6 +155,12 @@ def _bullets(items: List[str], limit: int) -> Text:
 
 
 def _panel_header(ver: str, index_ver: str, env_name: str, env_kind: str) -> Panel:
+    from rich import box
+    from rich.align import Align
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
     title = Text("Wagstaff-Lab Dashboard", style="bold white")
     meta = Text(f"version {ver} | index {index_ver} | env {env_name} ({env_kind})", style="dim")
     content = Group(Align.center(title), Align.center(meta))
@@ -115,10 +179,18 @@ def _panel_overview(objective: str, ver: str, index_ver: str, env_name: str, env
     return _panel("Overview", _kv_table(rows), border=PALETTE["accent"])
 
 
+@lru_cache(maxsize=1)
+def _empty_quality_panel() -> Panel:
+    from rich.text import Text
+
+    return _panel("Quality", Text("quality_gate_report.json missing", style="dim"), border=PALETTE["warn"])
+
+
 def _panel_quality(summary: Dict[str, Any]) -> Panel:
+    from rich.text import Text
+
     if not summary:
-        body = Text("quality_gate_report.json missing", style="dim")
-        return _panel("Quality", body, border=PALETTE["warn"])
+        return _empty_quality_panel()
 
     issues_total = summary.get("issues_total")
     issues_fail = summary.get("issues_fail")
@@ -151,8 +223,8 @@ def _panel_quality(summary: Dict[str, Any]) -> Panel:
         rows.append(("Catalog", f"items={items_total} stats={items_stats} ({stats_ratio})"))
     if trace_items is not None:
         rows.append(("Trace", f"items={trace_items} cooking={trace_cooking}"))
-    i18n_cov = summary.get("i18n_coverage") if isinstance(summary.get("i18n_coverage"), dict) else {}
-    for lang, row in (i18n_cov or {}).items():
+    for lang, row in as_dict(summary.get("i18n_coverage")).items():
+        row = as_dict(row)
         ratio_str = _ratio(row.get("ratio"))
         rows.append((f"i18n:{lang}", f"names={row.get('names')} ({ratio_str})"))
     if mech_components is not None:
@@ -164,6 +236,11 @@ def _panel_quality(summary: Dict[str, Any]) -> Panel:
 
 
 def _panel_tasks(status: Dict[str, Any]) -> Panel:
+    from rich.columns import Columns
+    from rich.console import Group
+    from rich.rule import Rule
+    from rich.text import Text
+
     todo = status.get("TASKS_TODO") or []
     done = status.get("TASKS_DONE") or []
     logs = status.get("RECENT_LOGS") or []
@@ -192,16 +269,18 @@ def _panel_tasks(status: Dict[str, Any]) -> Panel:
 
 
 def _panel_reports() -> Panel:
-    manifest_path = REPORT_DIR / "wagstaff_report_manifest.json"
-    manifest = read_json(manifest_path) or {}
-    counts = manifest.get("counts") if isinstance(manifest, dict) else None
-    counts = counts if isinstance(counts, dict) else {}
-    reports = manifest.get("reports") if isinstance(manifest, dict) else None
-    reports = reports if isinstance(reports, list) else []
+    from rich.console import Group
+    from rich.rule import Rule
+    from rich.text import Text
+
+    manifest_path = _REPORT_MANIFEST
+    manifest = as_dict(read_json(manifest_path))
+    counts = as_dict(manifest.get("counts"))
+    reports = as_list(manifest.get("reports"))
 
     manifest_info = file_info(manifest_path)
-    report_hub_path = REPORT_DIR / "index.html"
-    portal_path = REPORT_DIR / "portal_index.html"
+    report_hub_path = _REPORT_HUB
+    portal_path = _PORTAL_HUB
     report_info = file_info(report_hub_path)
     portal_info = file_info(portal_path)
 
@@ -209,18 +288,17 @@ def _panel_reports() -> Panel:
         ("Reports", f"{counts.get('reports', 0)} total"),
         ("Missing", str(counts.get("missing", 0))),
         ("Partial", str(counts.get("partial", 0))),
-        ("Manifest", f"{manifest_path.relative_to(PROJECT_ROOT)} ({human_mtime(manifest_info['mtime'])})"),
-        ("Report UI", f"{report_hub_path.relative_to(PROJECT_ROOT)} ({human_mtime(report_info['mtime'])})"),
-        ("Portal UI", f"{portal_path.relative_to(PROJECT_ROOT)} ({human_mtime(portal_info['mtime'])})"),
+        ("Manifest", f"{_REL_PATHS[manifest_path]} ({human_mtime(manifest_info['mtime'])})"),
+        ("Report UI", f"{_REL_PATHS[report_hub_path]} ({human_mtime(report_info['mtime'])})"),
+        ("Portal UI", f"{_REL_PATHS[portal_path]} ({human_mtime(portal_info['mtime'])})"),
     ]
 
-    attention = []
-    for rep in reports:
-        if not isinstance(rep, dict):
-            continue
-        status = str(rep.get("status") or "missing")
-        if status in {"missing", "partial"}:
-            attention.append(f"- {rep.get('title') or rep.get('id')} ({status})")
+    statuses = [(rep, str(rep.get("status") or "missing")) for rep in reports if isinstance(rep, dict)]
+    attention = [
+        f"- {rep.get('title') or rep.get('id')} ({status})"
+        for rep, status in statuses
+        if status in ("missing", "partial")
+    ]
 
     attention_block = Text("\n".join(attention), style="dim") if attention else Text("No missing reports.", style="dim")
     body = Group(_kv_table(rows), Rule(style="dim"), attention_block)
@@ -228,26 +306,31 @@ def _panel_reports() -> Panel:
 
 
 def _panel_artifacts() -> Panel:
-    rows = _artifact_rows()
+    from rich.console import Group
+    from rich.rule import Rule
+    from rich.text import Text
+
+    rows = _ARTIFACT_ROWS
+    index_manifest = _INDEX_MANIFEST
+    infos = _infos_by_path([path for _, path in rows] + [index_manifest])
     missing = []
     latest = None
     for name, path in rows:
-        info = file_info(path)
+        info = infos[path]
         if not info["exists"]:
             missing.append(name)
         if info["mtime"]:
             latest = max(latest or 0, info["mtime"])
 
     ok_count = len(rows) - len(missing)
-    index_manifest = INDEX_DIR / "wagstaff_index_manifest.json"
-    manifest_info = file_info(index_manifest)
+    manifest_info = infos[index_manifest]
 
     summary = _kv_table(
         [
             ("Artifacts", f"{ok_count}/{len(rows)} ok"),
             ("Missing", str(len(missing))),
             ("Latest", human_mtime(latest)),
-            ("Manifest", f"{index_manifest.relative_to(PROJECT_ROOT)} ({human_mtime(manifest_info['mtime'])})"),
+            ("Manifest", f"{_REL_PATHS[index_manifest]} ({human_mtime(manifest_info['mtime'])})"),
         ]
     )
 
@@ -259,148 +342,172 @@ def _panel_artifacts() -> Panel:
 
 
 def _panel_docs() -> Panel:
+    from rich import box
+    from rich.table import Table
+
     table = Table(box=box.MINIMAL, show_header=True, header_style="bold cyan")
     table.add_column("Doc", style="bold", no_wrap=True)
     table.add_column("Updated", style="dim", no_wrap=True)
     table.add_column("Path", style="dim")
 
-    docs = [
-        ("DEV_GUIDE", PROJECT_ROOT / "docs" / "guides" / "DEV_GUIDE.md"),
-        ("CLI_GUIDE", PROJECT_ROOT / "docs" / "guides" / "CLI_GUIDE.md"),
-        ("PROJECT_MANAGEMENT", PROJECT_ROOT / "docs" / "management" / "PROJECT_MANAGEMENT.md"),
-        ("CATALOG_V2_SPEC", PROJECT_ROOT / "docs" / "specs" / "CATALOG_V2_SPEC.md"),
-        ("MECHANISM_INDEX_SPEC", PROJECT_ROOT / "docs" / "specs" / "MECHANISM_INDEX_SPEC.md"),
-        ("SQLITE_V4_SPEC", PROJECT_ROOT / "docs" / "specs" / "SQLITE_V4_SPEC.md"),
-        ("ROADMAP", PROJECT_ROOT / "docs" / "management" / "ROADMAP.md"),
-    ]
-
-    for name, path in docs:
-        info = file_info(path)
-        table.add_row(name, human_mtime(info["mtime"]), str(path.relative_to(PROJECT_ROOT)))
+    infos = _infos_by_path([path for _, path, _ in _DOC_ROWS])
+    rows = [(name, human_mtime(infos[path]["mtime"]), rel) for name, path, rel in _DOC_ROWS]
+    for row in rows:
+        table.add_row(*row)
 
     return _panel("Docs", table, border=PALETTE["accent"])
 
 
-def _render_tools() -> None:
-    tools = get_tools()
-    order = [
-        "Entry",
-        "Health",
-        "Query",
-        "Explore",
-        "Mgmt",
-        "Build",
-        "Quality",
-        "Reports",
-        "Ops",
-        "Server",
-        "Utility",
-        "Other",
-    ]
-    mapping = {
-        "Entry": {"dash"},
-        "Health": {"doctor"},
-        "Query": {"wiki"},
-        "Explore": {"exp"},
-        "Mgmt": {"mgmt"},
-        "Build": {
-            "resindex",
-            "catalog2",
-            "catalog-sqlite",
-            "catindex",
-            "i18n",
-            "icons",
-            "farming-defs",
-            "mechanism-index",
-            "behavior-graph",
-            "index-manifest",
-        },
-        "Quality": {"quality"},
-        "Reports": {"report", "portal"},
-        "Ops": {"web"},
-        "Server": {"server"},
-        "Utility": {"snap", "samples", "farming-sim"},
-    }
-
-    grouped: Dict[str, List[Dict[str, Any]]] = {k: [] for k in order}
-    for tool in tools:
+_TOOL_GROUP_ORDER: Tuple[str, ...] = (
+    "Entry",
+    "Health",
+    "Query",
+    "Explore",
+    "Mgmt",
+    "Build",
+    "Quality",
+    "Reports",
+    "Ops",
+    "Server",
+    "Utility",
+    "Other",
+)
+
+_TOOL_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "Entry": ("dash",),
+    "Health": ("doctor",),
+    "Query": ("wiki",),
+    "Explore": ("exp",),
+    "Mgmt": ("mgmt",),
+    "Build": (
+        "resindex",
+        "catalog2",
+        "catalog-sqlite",
+        "catindex",
+        "i18n",
+        "icons",
+        "farming-defs",
+        "mechanism-index",
+        "behavior-graph",
+        "index-manifest",
+    ),
+    "Quality": ("quality",),
+    "Reports": ("report", "portal"),
+    "Ops": ("web",),
+    "Server": ("server",),
+    "Utility": ("snap", "samples", "farming-sim"),
+}
+
+_ALIAS_BUCKET: Dict[str, str] = {alias: label for label, names in _TOOL_GROUPS.items() for alias in names}
+
+
+def _tool_rows() -> List[Tuple[str, str, str, str]]:
+    """(group, command, desc, usage) rows in display order; group is set on a group's first row only."""
+    grouped: Dict[str, List[Dict[str, Any]]] = {k: [] for k in _TOOL_GROUP_ORDER}
+    for tool in get_tools():
         alias = tool.get("alias") or tool.get("file") or ""
-        bucket = "Other"
-        for label, names in mapping.items():
-            if alias in names:
-                bucket = label
-                break
-        grouped[bucket].append(tool)
+        grouped[_ALIAS_BUCKET.get(alias, "Other")].append(tool)
+
+    rows: List[Tuple[str, str, str, str]] = []
+    for label in _TOOL_GROUP_ORDER:
+        for idx, tool in enumerate(grouped.get(label) or []):
+            name = tool.get("alias") or tool.get("file") or "-"
+            cmd = f"wagstaff {name}" if tool.get("alias") else "wagstaff"
+            rows.append((label if idx == 0 else "", cmd, tool.get("desc", "-"), tool.get("usage") or ""))
+    return rows
+
+
+def _tools_table() -> Table:
+    from rich import box
+    from rich.table import Table
+    from rich.text import Text
 
     table = Table(title="Commands", box=box.MINIMAL, show_header=True, header_style="bold cyan")
     table.add_column("Group", style="bold", no_wrap=True)
     table.add_column("Command", style="bold", no_wrap=True)
     table.add_column("Details", ratio=1)
 
-    for label in order:
-        rows = grouped.get(label) or []
-        if not rows:
-            continue
-        for idx, tool in enumerate(rows):
-            name = tool.get("alias") or tool.get("file") or "-"
-            cmd = f"wagstaff {name}" if tool.get("alias") else "wagstaff"
-            desc = tool.get("desc", "-")
-            usage = tool.get("usage") or ""
-            details = Text(desc)
-            if usage:
-                details.append("\n")
-                details.append(usage, style="dim")
-            table.add_row(label if idx == 0 else "", cmd, details)
+    for label, cmd, desc, usage in _tool_rows():
+        details = Text(desc)
+        if usage:
+            details.append("\n")
+            details.append(usage, style="dim")
+        table.add_row(label, cmd, details)
 
-    console.print(table)
+    return table
+
+
+def _tools_plain() -> str:
+    """Pre-aligned text version of the commands table for non-terminal output."""
+    rows = _tool_rows()
+    header = ("Group", "Command", "Details")
+    w_group = max([len(header[0])] + [len(r[0]) for r in rows])
+    w_cmd = max([len(header[1])] + [len(r[1]) for r in rows])
+    pad = " " * (w_group + w_cmd + 4)
+    lines = ["Commands", f"{header[0]:<{w_group}}  {header[1]:<{w_cmd}}  {header[2]}"]
+    for label, cmd, desc, usage in rows:
+        lines.append(f"{label:<{w_group}}  {cmd:<{w_cmd}}  {desc}")
+        if usage:
+            lines.append(pad + usage)
+    return "\n".join(lines)
 
 
 def main() -> None:
-    status = load_status()
-    objective = status.get("OBJECTIVE") or status.get("objective") or "-"
-    env_name, env_kind = env_hint()
-    ver = project_version()
-    version_doc = read_json(CONF_DIR / "version.json") or {}
-    index_ver = str(version_doc.get("index_version") or "-")
-
-    qdoc = read_json(REPORT_DIR / "quality_gate_report.json") or {}
-    summary = qdoc.get("summary") if isinstance(qdoc, dict) else None
-    summary = summary if isinstance(summary, dict) else {}
-
-    console.print(_panel_header(ver, index_ver, env_name, env_kind))
-    console.print(
-        Columns(
-            [
-                _panel_overview(objective, ver, index_ver, env_name, env_kind),
-                _panel_quality(summary),
-            ],
-            equal=True,
-            expand=True,
-        )
-    )
-    console.print(
-        Columns(
-            [
-                _panel_tasks(status),
-                _panel_reports(),
-            ],
-            equal=True,
-            expand=True,
+    from rich.columns import Columns
+    from rich.console import Console, Group
+    from rich.text import Text
+
+    console = Console()
+    # Panels that only touch the filesystem are built off the main thread so
+    # their stats/reads overlap; the composed dashboard is printed once.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        reports_job = pool.submit(_panel_reports)
+        artifacts_job = pool.submit(_panel_artifacts)
+        docs_job = pool.submit(_panel_docs)
+
+        status = load_status()
+        objective = status.get("OBJECTIVE") or status.get("objective") or "-"
+        env_name, env_kind = env_hint()
+        version_doc = as_dict(read_json(CONF_DIR / "version.json"))
+        ver = _version_field(version_doc, "project_version") or "unknown"
+        index_ver = _version_field(version_doc, "index_version") or "-"
+
+        summary = as_dict(as_dict(read_json(REPORT_DIR / "quality_gate_report.json")).get("summary"))
+
+        dashboard = Group(
+            _panel_header(ver, index_ver, env_name, env_kind),
+            Columns(
+                [
+                    _panel_overview(objective, ver, index_ver, env_name, env_kind),
+                    _panel_quality(summary),
+                ],
+                equal=True,
+                expand=True,
+            ),
+            Columns(
+                [
+                    _panel_tasks(status),
+                    reports_job.result(),
+                ],
+                equal=True,
+                expand=True,
+            ),
+            Columns(
+                [
+                    artifacts_job.result(),
+                    docs_job.result(),
+                ],
+                equal=True,
+                expand=True,
+            ),
+            "",
+            # Piped/CI output skips Rich table layout for the largest table.
+            _tools_table() if console.is_terminal else Text(_tools_plain(), no_wrap=True, overflow="ignore"),
+            "\n[dim]Tips: wagstaff quality | wagstaff report build --quality | wagstaff catindex | wagstaff snap[/dim]",
         )
-    )
-    console.print(
-        Columns(
-            [
-                _panel_artifacts(),
-                _panel_docs(),
-            ],
-            equal=True,
-            expand=True,
-        )
-    )
-    console.print("")
-    _render_tools()
-    console.print("\n[dim]Tips: wagstaff quality | wagstaff report build --quality | wagstaff catindex | wagstaff snap[/dim]")
+
+    # Plain tool rows may exceed the fallback 80-column width; don't crop them.
+    console.print(dashboard, crop=console.is_terminal)
 
 
 if __name__ == "__main__":
@@ -7,24 +7,34 @@ import configparser
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from apps.cli.cli_common import (
+    CACHE_DIR,
     CONF_DIR,
     INDEX_DIR,
     PROJECT_ROOT,
     env_hint,
-    file_info,
-    human_mtime,
-    human_size,
+    file_row,
+    keyed_json_cache,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.text import Text
+
 CONFIG_PATH = CONF_DIR / "settings.ini"
+SCREEN_CACHE_PATH = CACHE_DIR / "doctor.json"
+
+ARTIFACTS = (
+    ("catalog_v2", INDEX_DIR / "wagstaff_catalog_v2.json"),
+    ("catalog_index", INDEX_DIR / "wagstaff_catalog_index_v1.json"),
+    ("icon_index", INDEX_DIR / "wagstaff_icon_index_v1.json"),
+    ("i18n_index", INDEX_DIR / "wagstaff_i18n_v1.json"),
+    ("tuning_trace", INDEX_DIR / "wagstaff_tuning_trace_v1.json"),
+)
 
 
 def _expand(p: str) -> str:
@@ -39,12 +49,16 @@ def _cfg_get(cfg: configparser.ConfigParser, section: str, key: str) -> str:
     return _expand(v) if v else ""
 
 
-def _status(level: str) -> str:
-    if level == "PASS":
-        return "[green]PASS[/green]"
-    if level == "WARN":
-        return "[yellow]WARN[/yellow]"
-    return "[red]FAIL[/red]"
+_STATUS_STYLES = {"PASS": "green", "WARN": "yellow"}
+
+
+@lru_cache(maxsize=None)
+def _status(level: str) -> Text:
+    """Pre-styled status cell, built once per level so rows skip the markup parser."""
+    from rich.text import Text
+
+    style = _STATUS_STYLES.get(level)
+    return Text(level, style=style) if style else Text("FAIL", style="red")
 
 
 def _check_path_exists(path: Path, kind: str, fix: str = ""):
@@ -58,12 +72,54 @@ def _check_path_exists(path: Path, kind: str, fix: str = ""):
     return ok, level, str(path), fix
 
 
+def _probe_screen() -> Tuple[Optional[str], Optional[int], str]:
+    """Return (screen path, `screen -version` exit code, error text).
+
+    The exit code is cached per screen binary (path + mtime + size) so repeated
+    doctor runs skip the process spawn.
+    """
+    screen_path = shutil.which("screen")
+    if not screen_path:
+        return None, None, ""
+    try:
+        st = os.stat(screen_path)
+        key = [screen_path, st.st_mtime_ns, st.st_size]
+    except OSError:
+        key = None
+
+    def run() -> int:
+        return subprocess.run(
+            ["screen", "-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=2,
+        ).returncode
+
+    try:
+        return screen_path, keyed_json_cache(SCREEN_CACHE_PATH, key, run), ""
+    except Exception as e:
+        return screen_path, None, str(e)
+
+
 def main() -> int:
     p = argparse.ArgumentParser(description="Wagstaff Doctor (environment + data health check)")
     p.add_argument("--enforce", action="store_true", help="exit non-zero on failures (CI)")
     p.add_argument("--strict", action="store_true", help="treat WARN as FAIL (only when --enforce)")
     args = p.parse_args()
 
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = Console()
+
+    # Independent probes (artifact stats + the screen subprocess) run in the
+    # background while the config-driven checks below proceed.
+    pool = ThreadPoolExecutor(max_workers=len(ARTIFACTS) + 1)
+    screen_job = pool.submit(_probe_screen)
+    artifact_jobs = [(name, pool.submit(file_row, path)) for name, path in ARTIFACTS]
+    pool.shutdown(wait=False)
+
     env_name, env_kind = env_hint()
     console.print(Panel(f"[bold cyan]Wagstaff Doctor[/bold cyan]\nEnv: {env_name} ({env_kind})", border_style="cyan"))
 
@@ -95,24 +151,16 @@ def main() -> int:
     backup_dir = _cfg_get(cfg, "PATHS", "BACKUP_DIR") if ok else ""
 
     # 2) data artifacts
-    artifacts = [
-        ("catalog_v2", INDEX_DIR / "wagstaff_catalog_v2.json"),
-        ("catalog_index", INDEX_DIR / "wagstaff_catalog_index_v1.json"),
-        ("icon_index", INDEX_DIR / "wagstaff_icon_index_v1.json"),
-        ("i18n_index", INDEX_DIR / "wagstaff_i18n_v1.json"),
-        ("tuning_trace", INDEX_DIR / "wagstaff_tuning_trace_v1.json"),
-    ]
-    for name, path in artifacts:
-        info = file_info(path)
-        level = "PASS" if info["exists"] else "WARN"
-        details = f"{human_mtime(info['mtime'])} | {human_size(info['size'])}"
+    for name, job in artifact_jobs:
+        exists, mtime_str, size_str, _ = job.result()
+        level = "PASS" if exists else "WARN"
         table.add_row(
             f"data/{name}",
             _status(level),
-            details if info["exists"] else "missing",
-            "Run the matching build_* script" if not info["exists"] else "",
+            f"{mtime_str} | {size_str}" if exists else "missing",
+            "Run the matching build_* script" if not exists else "",
         )
-        if not info["exists"]:
+        if not exists:
             warn += 1
 
     # 3) DST root + scripts source (optional)
@@ -142,19 +190,17 @@ def main() -> int:
             warn += 1
 
     # 5) screen (optional)
-    screen_path = shutil.which("screen")
+    screen_path, screen_rc, screen_err = screen_job.result()
     if not screen_path:
         table.add_row("screen installed", _status("WARN"), "(not found)", "sudo apt-get install screen")
         warn += 1
+    elif screen_rc is None:
+        table.add_row("screen installed", _status("WARN"), screen_err, "Verify screen is executable")
+        warn += 1
     else:
-        try:
-            r = subprocess.run(["screen", "-version"], capture_output=True, text=True)
-            level = "PASS" if (r.returncode == 0) else "WARN"
-            table.add_row("screen installed", _status(level), screen_path, "")
-            if level == "WARN":
-                warn += 1
-        except Exception as e:
-            table.add_row("screen installed", _status("WARN"), str(e), "Verify screen is executable")
+        level = "PASS" if (screen_rc == 0) else "WARN"
+        table.add_row("screen installed", _status(level), screen_path, "")
+        if level == "WARN":
             warn += 1
 
     # 6) backup dir (optional)
@@ -6,24 +6,28 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from apps.cli.cli_common import PROJECT_ROOT, load_status
+from apps.cli.cli_common import PROJECT_ROOT, STATUS_PATH, as_list, load_status, write_json_atomic
 from apps.cli.i18n import resolve_lang, status_label, t
-from apps.cli.mgmt_parser import Milestone, Task, parse_milestones, parse_tasks, read_text
+from apps.cli.mgmt_parser import Milestone, Task, load_mgmt
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-except Exception:  # pragma: no cover
-    Console = None
-    Table = None
+def _load_rich() -> Tuple[Any, Any]:
+    """Import Rich on demand so `dump`/`sync` never pay for it; (None, None) if missing."""
+    try:
+        from rich.console import Console
+        from rich.table import Table
+    except Exception:  # pragma: no cover
+        return None, None
+    return Console, Table
 
 
-def _default_mgmt_path() -> Path:
-    status = load_status()
+def _default_mgmt_path(status: Dict[str, Any]) -> Path:
     doc = status.get("MANAGEMENT_DOC")
     if isinstance(doc, str) and doc:
         return (PROJECT_ROOT / doc).resolve()
@@ -31,12 +35,13 @@ def _default_mgmt_path() -> Path:
 
 
 def _render_status(tasks: List[Task], milestones: List[Milestone], doc_path: Path, lang: str) -> None:
+    Console, Table = _load_rich()
     if Console is None or Table is None:
         print(f"{t('mgmt.doc_label', lang)}: {doc_path}")
         print(f"{t('mgmt.milestones_count', lang)}: {len(milestones)}")
         print(f"{t('mgmt.tasks_count', lang)}: {len(tasks)}")
-        for task in tasks:
-            print(f"- {task.key} {task.desc}")
+        if tasks:
+            print("\n".join(f"- {task.key} {task.desc}" for task in tasks))
         return
 
     console = Console()
@@ -50,8 +55,9 @@ def _render_status(tasks: List[Task], milestones: List[Milestone], doc_path: Pat
     table.add_column(t("mgmt.key", lang), style="bold")
     table.add_column(t("mgmt.title", lang))
     table.add_column(t("mgmt.status", lang), style="green")
+    labels = {status: status_label(status, lang) for status in {m.status for m in milestones}}
     for m in milestones:
-        table.add_row(m.key, m.title, status_label(m.status, lang))
+        table.add_row(m.key, m.title, labels[m.status])
     console.print(table)
 
     summary = (
@@ -62,17 +68,16 @@ def _render_status(tasks: List[Task], milestones: List[Milestone], doc_path: Pat
     console.print(f"[dim]{summary}[/dim]")
 
     if tasks:
-        console.print(f"[bold]{t('mgmt.tasks_title', lang)}[/bold]")
-        for task in tasks:
-            console.print(f"- {task.key}: {task.desc}")
+        lines = [f"[bold]{t('mgmt.tasks_title', lang)}[/bold]"]
+        lines.extend(f"- {task.key}: {task.desc}" for task in tasks)
+        console.print("\n".join(lines))
 
 
-def _sync_tasks(status_path: Path, tasks: List[Task], write: bool, lang: str) -> int:
-    status_doc = load_status()
+def _sync_tasks(status_path: Path, status: Dict[str, Any], tasks: List[Task], write: bool, lang: str) -> int:
+    status_doc = dict(status)
     new_tasks = [f"{t.key}：{t.desc}" for t in tasks]
 
-    old_tasks = status_doc.get("TASKS_TODO") if isinstance(status_doc, dict) else None
-    old_tasks = list(old_tasks) if isinstance(old_tasks, list) else []
+    old_tasks = list(as_list(status_doc.get("TASKS_TODO")))
 
     if new_tasks == old_tasks:
         print(t("mgmt.no_changes", lang))
@@ -84,14 +89,12 @@ def _sync_tasks(status_path: Path, tasks: List[Task], write: bool, lang: str) ->
         return 0
 
     status_doc["TASKS_TODO"] = new_tasks
-    logs = status_doc.get("RECENT_LOGS")
-    if not isinstance(logs, list):
-        logs = []
+    logs = list(as_list(status_doc.get("RECENT_LOGS")))
     stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     logs.append(f"[{stamp}] Mgmt: sync TASKS_TODO from PROJECT_MANAGEMENT.md")
     status_doc["RECENT_LOGS"] = logs
 
-    status_path.write_text(json.dumps(status_doc, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json_atomic(status_path, status_doc)
     print(t("mgmt.tasks_updated", lang))
     return 0
 
@@ -105,35 +108,40 @@ def _dump_json(tasks: List[Task], milestones: List[Milestone], doc_path: Path) -
     print(json.dumps(payload, ensure_ascii=False, indent=2))
 
 
-def _file_age_days(path: Path) -> Optional[int]:
+def _contains(path: Path, needle: bytes) -> bool:
+    """Byte-level substring probe over a read-only mapping; stops at the first hit."""
     try:
-        mtime = path.stat().st_mtime
-    except Exception:
-        return None
-    delta = datetime.now() - datetime.fromtimestamp(mtime)
-    return int(delta.total_seconds() // 86400)
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+    except (OSError, ValueError):
+        return False
+
+
+def _age_days(mtime: float) -> int:
+    return int((time.time() - mtime) // 86400)
 
 
-def _check_dev_guide(lang: str) -> int:
+def _check_dev_guide(status: Dict[str, Any], lang: str) -> int:
     guide_path = PROJECT_ROOT / "docs" / "guides" / "DEV_GUIDE.md"
     readme_path = PROJECT_ROOT / "README.md"
-    mgmt_path = _default_mgmt_path()
+    mgmt_path = _default_mgmt_path(status)
 
-    if not guide_path.exists():
+    try:
+        guide_st = os.stat(guide_path)
+    except OSError:
         print(t("mgmt.devguide_missing", lang).format(path=guide_path))
         return 2
 
-    text = read_text(guide_path)
-    meta_ok = "DEV_GUIDE_META" in text
-    age_days = _file_age_days(guide_path)
-    age_note = f"{age_days}d" if age_days is not None else "unknown"
-    age_ok = (age_days is None) or (age_days <= 30)
+    meta_ok = _contains(guide_path, b"DEV_GUIDE_META")
+    age_days = _age_days(guide_st.st_mtime)
+    age_note = f"{age_days}d"
+    age_ok = age_days <= 30
 
-    readme_text = read_text(readme_path)
-    readme_ok = "DEV_GUIDE" in readme_text
+    readme_ok = _contains(readme_path, b"DEV_GUIDE")
 
     mgmt_ok = mgmt_path.exists()
 
+    Console, Table = _load_rich()
     if Console is None or Table is None:
         ok_label = t("status.ok", lang)
         warn_label = t("status.warn", lang)
@@ -189,25 +197,23 @@ def main() -> int:
     args = p.parse_args()
 
     lang = resolve_lang(args.lang)
-    doc_path = Path(args.doc).resolve() if args.doc else _default_mgmt_path()
-    text = read_text(doc_path)
-    if not text:
+    status = load_status()
+    doc_path = Path(args.doc).resolve() if args.doc else _default_mgmt_path(status)
+    parsed = load_mgmt(doc_path)
+    if parsed is None:
         raise SystemExit(t("mgmt.doc_missing", lang).format(path=doc_path))
-
-    tasks = parse_tasks(text)
-    milestones = parse_milestones(text)
+    tasks, milestones = parsed
 
     if args.action == "status":
         _render_status(tasks, milestones, doc_path, lang)
         return 0
     if args.action == "sync":
-        status_path = PROJECT_ROOT / "PROJECT_STATUS.json"
-        return _sync_tasks(status_path, tasks, write=bool(args.write), lang=lang)
+        return _sync_tasks(STATUS_PATH, status, tasks, write=bool(args.write), lang=lang)
     if args.action == "dump":
         _dump_json(tasks, milestones, doc_path)
         return 0
     if args.action == "check":
-        return _check_dev_guide(lang)
+        return _check_dev_guide(status, lang)
 
     return 0
 
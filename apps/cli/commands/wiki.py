@@ -9,12 +9,15 @@ Notes
 - Core parsing/indexing lives in `engine.py`, `craft_recipes.py`, `analyzer.py`, etc.
 """
 
+import difflib
 import math
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List
 
 from rich.console import Console
 from rich.panel import Panel
@@ -29,6 +32,10 @@ from core.version import project_version  # noqa: E402
 
 console = Console()
 
+_SCAN_BATCH = 256  # files probed per thread-pool round in `wiki find`
+_INV_PAIR_RE = re.compile(r"([A-Za-z0-9_]+)\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)")
+_INV_SPLIT_RE = re.compile(r"[\s,]+")
+
 
 def _parse_inventory_spec(spec: str) -> Dict[str, float]:
     """Parse inventory spec into {item: count}.
@@ -49,26 +56,54 @@ def _parse_inventory_spec(spec: str) -> Dict[str, float]:
         return out
 
     # Fast path: key=value / key:value pairs
-    pairs = re.findall(r"([A-Za-z0-9_]+)\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)", s)
-    for k, v in pairs:
-        try:
-            out[k] = out.get(k, 0.0) + float(v)
-        except Exception:
-            pass
+    # _INV_PAIR_RE only captures well-formed numbers, so float() cannot fail here.
+    for k, v in _INV_PAIR_RE.findall(s):
+        k = sys.intern(k)
+        out[k] = out.get(k, 0.0) + float(v)
 
     if out:
         return out
 
     # Fallback: plain tokens => count=1
-    tokens = re.split(r"[\s,]+", s)
+    tokens = _INV_SPLIT_RE.split(s)
     for t in tokens:
         t = (t or "").strip()
         if not t:
             continue
+        t = sys.intern(t)
         out[t] = out.get(t, 0.0) + 1.0
     return out
 
 
+def _first_matches(keys: Iterable[str], query: str, limit: int) -> List[str]:
+    """First *limit* keys containing *query*, in key order; stops scanning once full."""
+    return list(islice((k for k in keys if query in k), limit))
+
+
+def _covers(req, have) -> bool:
+    """True if every (item, count) in *req* is satisfied by the *have* lookup; empty/odd reqs fail fast."""
+    if not req:
+        return False
+    for it, cnt in req:
+        try:
+            need = float(cnt)
+        except Exception:
+            return False
+        if float(have(str(it), 0.0)) + 1e-9 < need:
+            return False
+    return True
+
+
+def _first(rest):
+    return rest[0] if rest else None
+
+
+def _print_not_found(message: str, close: List[str]) -> None:
+    console.print(f"[red]{message}[/red]")
+    if close:
+        console.print(f"[yellow]你是不是要找: {', '.join(close)}[/yellow]")
+
+
 class WagstaffWiki:
     def __init__(self):
         try:
@@ -77,82 +112,68 @@ class WagstaffWiki:
             console.print(f"[red]引擎初始化失败: {e}[/red]")
             sys.exit(1)
 
+        # top-level command -> handler(rest_of_args)
+        self._commands = {
+            "recipe": self._run_recipe,
+            "mob": lambda rest: self._analyze_prefab(_first(rest)),
+            "item": lambda rest: self._analyze_prefab(_first(rest)),
+            "loot": lambda rest: self._find_loot_table(_first(rest)),
+            "food": self._run_food,
+            "find": lambda rest: self._global_search_interactive(_first(rest)),
+        }
+        # `wiki recipe <sub> <query...>`: handlers take the joined query string
+        self._recipe_query_subs = {
+            "tab": self._list_recipe_by_tab,
+            "filter": self._list_recipe_by_filter,
+            "who": self._list_recipe_by_builder_tag,
+            "tech": self._list_recipe_by_tech,
+            "uses": self._list_recipe_by_ingredient,
+            "can": lambda q: self._list_recipe_craftable(_parse_inventory_spec(q)),
+        }
+
     def run(self, args):
-        if not args:
+        handler = self._commands.get(args[0].lower()) if args else None
+        if handler is None:
             self._print_help()
             return
-
-        command = args[0].lower()
-
-        if command == "recipe":
-            # Supported:
-            #   wiki recipe <name>
-            #   wiki recipe tab <TAB>
-            #   wiki recipe filter <FILTER>
-            #   wiki recipe who <BUILDER_TAG>
-            #   wiki recipe tech <TECH>
-            #   wiki recipe uses <ITEM>
-            #   wiki recipe can <INV_SPEC>
-            #   wiki recipe missing <RECIPE> <INV_SPEC>
-            if len(args) >= 2 and args[1].lower() in ("tab", "filter", "who", "tech", "uses", "can", "missing", "tabs", "filters"):
-                sub = args[1].lower()
-
-                if sub == "tabs":
-                    self._list_recipe_tabs()
-                elif sub == "filters":
-                    self._list_recipe_filters()
-                elif sub == "missing":
-                    if len(args) < 4:
-                        return console.print("[red]用法: wiki recipe missing <recipe> <inv>[/red]")
-                    recipe = args[2]
-                    inv = _parse_inventory_spec(" ".join(args[3:]))
-                    self._recipe_missing(recipe, inv)
-                else:
-                    if len(args) < 3:
-                        return console.print("[red]缺少参数[/red]")
-                    q = " ".join(args[2:])
-                    if sub == "tab":
-                        self._list_recipe_by_tab(q)
-                    elif sub == "filter":
-                        self._list_recipe_by_filter(q)
-                    elif sub == "who":
-                        self._list_recipe_by_builder_tag(q)
-                    elif sub == "tech":
-                        self._list_recipe_by_tech(q)
-                    elif sub == "uses":
-                        self._list_recipe_by_ingredient(q)
-                    elif sub == "can":
-                        inv = _parse_inventory_spec(q)
-                        self._list_recipe_craftable(inv)
-            else:
-                q = args[1] if len(args) > 1 else None
-                self._search_recipe(q)
-
-        elif command in ("mob", "item"):
-            q = args[1] if len(args) > 1 else None
-            self._analyze_prefab(q)
-
-        elif command == "loot":
-            q = args[1] if len(args) > 1 else None
-            self._find_loot_table(q)
-
-        elif command == "food":
-            # Minimal preparedfoods index
-            #   wiki food <name>
-            #   wiki food can <INV_SPEC>
-            if len(args) >= 2 and args[1].lower() == "can":
-                inv = _parse_inventory_spec(" ".join(args[2:]))
-                self._list_food_cookable(inv)
-            else:
-                q = args[1] if len(args) > 1 else None
-                self._show_food(q)
-
-        elif command == "find":
-            q = args[1] if len(args) > 1 else None
-            self._global_search_interactive(q)
-
+        handler(args[1:])
+
+    def _run_recipe(self, rest):
+        # Supported:
+        #   wiki recipe <name>
+        #   wiki recipe tab <TAB>
+        #   wiki recipe filter <FILTER>
+        #   wiki recipe who <BUILDER_TAG>
+        #   wiki recipe tech <TECH>
+        #   wiki recipe uses <ITEM>
+        #   wiki recipe can <INV_SPEC>
+        #   wiki recipe missing <RECIPE> <INV_SPEC>
+        #   wiki recipe tabs | filters
+        sub = rest[0].lower() if rest else ""
+        if sub == "tabs":
+            return self._list_recipe_tabs()
+        if sub == "filters":
+            return self._list_recipe_filters()
+        if sub == "missing":
+            if len(rest) < 3:
+                return console.print("[red]用法: wiki recipe missing <recipe> <inv>[/red]")
+            return self._recipe_missing(rest[1], _parse_inventory_spec(" ".join(rest[2:])))
+
+        handler = self._recipe_query_subs.get(sub)
+        if handler is None:
+            return self._search_recipe(_first(rest))
+        if len(rest) < 2:
+            return console.print("[red]缺少参数[/red]")
+        handler(" ".join(rest[1:]))
+
+    def _run_food(self, rest):
+        # Minimal preparedfoods index
+        #   wiki food <name>
+        #   wiki food can <INV_SPEC>
+        if rest and rest[0].lower() == "can":
+            self._list_food_cookable(_parse_inventory_spec(" ".join(rest[1:])))
         else:
-            self._print_help()
+            self._show_food(_first(rest))
 
     def _print_help(self):
         ver = project_version()
@@ -197,9 +218,10 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
         if not recipe_data:
             # fallback: 子串匹配
             db = self.engine.recipes  # type: ignore[assignment]
-            candidates = [k for k in db.recipes.keys() if query in k]
+            # Only the first 8 candidates are ever shown, so stop scanning there.
+            candidates = _first_matches(db.recipes.keys(), query, 8)
             if not candidates:
-                return console.print(f"[red]未找到配方: {query}[/red]")
+                return _print_not_found(f"未找到配方: {query}", difflib.get_close_matches(query, db.recipes.keys(), n=8))
             if len(candidates) > 1:
                 console.print(f"[yellow]可能的匹配: {', '.join(candidates[:8])}...[/yellow]")
                 return
@@ -209,7 +231,8 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
         tech = str(recipe_data.get("tech", "UNKNOWN"))
 
         filters = recipe_data.get("filters") or []
-        builder_tags = recipe_data.get("builder_tags") or ([] if recipe_data.get("builder_tag") is None else [recipe_data.get("builder_tag")])
+        # CraftRecipeDB already folds `builder_tag` into `builder_tags` at build time.
+        builder_tags = recipe_data.get("builder_tags") or []
         product = recipe_data.get("product") or None
 
         grid = Table.grid(expand=True)
@@ -222,7 +245,7 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
         if filters:
             grid.add_row(f"[bold]Filters:[/bold] {', '.join(filters)}", "")
         if builder_tags:
-            grid.add_row(f"[bold]角色专属:[/bold] {', '.join([str(x) for x in builder_tags])}", "")
+            grid.add_row(f"[bold]角色专属:[/bold] {', '.join(map(str, builder_tags))}", "")
         if product:
             grid.add_row(f"[bold]产物:[/bold] {product}", "")
 
@@ -249,11 +272,11 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
 
         # 只展示前 80 条，避免刷屏（后续可做交互分页）
         show = names[:80]
+        # Names come from list_* results and are already canonical; skip alias resolution.
+        get_raw = self.engine.recipes.get_raw  # type: ignore[union-attr]
         for i, nm in enumerate(show, start=1):
-            _, r = self.engine.recipes.get(nm)  # type: ignore[union-attr]
-            tab = str((r or {}).get("tab", "UNKNOWN"))
-            tech = str((r or {}).get("tech", "UNKNOWN"))
-            table.add_row(str(i), nm, tab, tech)
+            r = get_raw(nm) or {}
+            table.add_row(str(i), nm, str(r.get("tab", "UNKNOWN")), str(r.get("tech", "UNKNOWN")))
 
         console.print(Panel(table, border_style="blue"))
         if len(names) > 80:
@@ -348,9 +371,10 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
         db = self.engine.cooking_recipes or {}
         if query not in db:
             # fuzzy contains
-            cands = [k for k in db.keys() if query in k]
+            # Only the first 10 candidates are ever shown, so stop scanning there.
+            cands = _first_matches(db.keys(), query, 10)
             if not cands:
-                return console.print(f"[red]未找到食谱: {query}[/red]")
+                return _print_not_found(f"未找到食谱: {query}", difflib.get_close_matches(query, db.keys(), n=10))
             if len(cands) > 1:
                 console.print(f"[yellow]可能的匹配: {', '.join(cands[:10])}...[/yellow]")
                 return
@@ -386,26 +410,8 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
         if not db:
             return console.print("[yellow]未加载 cooking recipes[/yellow]")
 
-        ok: List[str] = []
-        for name, rec in db.items():
-            req = rec.get("card_ingredients")
-            if not req:
-                continue
-            good = True
-            for it, cnt in req:
-                try:
-                    need = float(cnt)
-                except Exception:
-                    good = False
-                    break
-                have = float(inv.get(str(it), 0.0))
-                if have + 1e-9 < need:
-                    good = False
-                    break
-            if good:
-                ok.append(name)
-
-        ok = sorted(ok)
+        have = inv.get
+        ok = sorted(name for name, rec in db.items() if _covers(rec.get("card_ingredients"), have))
         table = Table(title=f"Cookable (approx) ({len(ok)})", box=None, show_header=True, header_style="bold dim")
         table.add_column("No.", justify="right", style="dim", width=4)
         table.add_column("Food", style="cyan")
@@ -473,23 +479,11 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
             return console.print("[red]请输入掉落表名称 (例如: krampus)[/red]")
 
         console.print(f"[dim]正在全库搜索掉落表: '{query}' ...[/dim]")
-        pattern = re.compile(r"SetSharedLootTable\s*\(\s*[\'\"]" + re.escape(query) + r"[\'\"]")
-
-        found = False
-        for filepath in self.engine.file_list:
-            if not filepath.endswith(".lua"):
-                continue
-            content = self.engine.read_file(filepath)
-            if not content:
-                continue
-
-            if pattern.search(content):
-                self._render_loot_table(filepath, query, content)
-                found = True
-                break
-
-        if not found:
-            console.print(f"[red]未找到掉落表定义: '{query}'[/red]")
+        filepath = self.engine.find_loot_table(query)
+        content = self.engine.read_file(filepath) if filepath else None
+        if not content:
+            return console.print(f"[red]未找到掉落表定义: '{query}'[/red]")
+        self._render_loot_table(filepath, query, content)
 
     def _render_loot_table(self, filepath, table_name, content):
         console.print(f"[bold green]✅ 找到定义文件: {filepath}[/bold green]")
@@ -517,57 +511,84 @@ INV 格式例：twigs=2,flint=1  或  twigs:2 flint:1
 
         console.print(Panel(table, border_style="gold1"))
 
+    def _iter_matches(self, needle: bytes) -> Iterator[str]:
+        """Yield files containing *needle* in `file_list` order, probing one batch at a time.
+
+        Reads (and zip inflation) release the GIL, so each batch is probed concurrently;
+        closing the generator early stops the scan after the current batch.
+        """
+        files = self.engine.file_list
+        contains = self.engine.file_contains
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            for start in range(0, len(files), _SCAN_BATCH):
+                batch = files[start:start + _SCAN_BATCH]
+                for f, hit in zip(batch, pool.map(lambda f: contains(f, needle), batch)):
+                    if hit:
+                        yield f
+
     def _global_search_interactive(self, query):
         if not query:
             return console.print("[red]请输入搜索关键词[/red]")
 
         console.print(f"[bold cyan]🔍 正在扫描全库: '{query}' ...[/bold cyan]")
 
-        matches = []
-        for f in self.engine.file_list:
-            content = self.engine.read_file(f)
-            if content and query in content:
-                matches.append(f)
-
-        total_count = len(matches)
-        if total_count == 0:
-            return console.print("[yellow]❌ 无结果[/yellow]")
+        per_page = 15
+        scan = self._iter_matches(query.encode(self.engine.encoding, errors="replace"))
+        matches: List[str] = []
+        exhausted = False
+
+        def fill(page: int) -> None:
+            # Scan just far enough to show *page* and to know whether a next page exists.
+            nonlocal exhausted
+            while not exhausted and len(matches) <= page * per_page:
+                f = next(scan, None)
+                if f is None:
+                    exhausted = True
+                else:
+                    matches.append(f)
 
         page = 1
-        per_page = 15
-        total_pages = math.ceil(total_count / per_page)
-
-        while True:
-            console.clear()
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-            current_batch = matches[start_idx:end_idx]
-
-            console.print(Panel(f"🔍 关键词: [bold green]{query}[/bold green] | 命中: {total_count} 文件", style="blue"))
-
-            table = Table(box=None, show_header=True, header_style="bold dim")
-            table.add_column("No.", justify="right", style="dim", width=4)
-            table.add_column("文件路径", style="cyan")
-
-            for i, f in enumerate(current_batch):
-                idx = start_idx + i + 1
-                dir_path, fname = os.path.split(f)
-                display_path = f"{dir_path}/[bold white]{fname}[/bold white]"
-                table.add_row(str(idx), display_path)
-
-            console.print(table)
-            status_color = "green" if page == total_pages else "yellow"
-            console.print(f"\n[dim]📄 页码: [{status_color}]{page}/{total_pages}[/{status_color}][/dim]")
-            console.print("[dim]操作: n 下一页 | p 上一页 | q 退出[/dim]")
-
-            cmd = input("\n> ").strip().lower()
-            if cmd == "q":
-                break
-            elif cmd == "n" and page < total_pages:
-                page += 1
-            elif cmd == "p" and page > 1:
-                page -= 1
+        fill(page)
+        if not matches:
+            return console.print("[yellow]❌ 无结果[/yellow]")
 
+        try:
+            while True:
+                console.clear()
+                start_idx = (page - 1) * per_page
+                end_idx = start_idx + per_page
+                current_batch = matches[start_idx:end_idx]
+
+                total_label = str(len(matches)) if exhausted else f"{len(matches)}+"
+                total_pages = str(math.ceil(len(matches) / per_page)) if exhausted else "?"
+                console.print(Panel(f"🔍 关键词: [bold green]{query}[/bold green] | 命中: {total_label} 文件", style="blue"))
+
+                table = Table(box=None, show_header=True, header_style="bold dim")
+                table.add_column("No.", justify="right", style="dim", width=4)
+                table.add_column("文件路径", style="cyan")
+
+                for i, f in enumerate(current_batch):
+                    idx = start_idx + i + 1
+                    dir_path, fname = os.path.split(f)
+                    display_path = f"{dir_path}/[bold white]{fname}[/bold white]"
+                    table.add_row(str(idx), display_path)
+
+                console.print(table)
+                has_next = len(matches) > end_idx
+                status_color = "yellow" if has_next else "green"
+                console.print(f"\n[dim]📄 页码: [{status_color}]{page}/{total_pages}[/{status_color}][/dim]")
+                console.print("[dim]操作: n 下一页 | p 上一页 | q 退出[/dim]")
+
+                cmd = input("\n> ").strip().lower()
+                if cmd == "q":
+                    break
+                elif cmd == "n" and has_next:
+                    page += 1
+                    fill(page)
+                elif cmd == "p" and page > 1:
+                    page -= 1
+        finally:
+            scan.close()
 
 def main(argv=None):
     argv = argv or sys.argv[1:]
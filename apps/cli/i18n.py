@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -85,12 +86,26 @@ TEXTS: Dict[str, Dict[str, str]] = {
 
 
 def resolve_lang(lang: Optional[str] = None) -> str:
-    raw = (lang or os.environ.get("WAGSTAFF_LANG") or "").strip().lower().replace("_", "-")
+    if lang:
+        return _normalize_lang(lang)
+    return _env_lang()
+
+
+@lru_cache(maxsize=1)
+def _env_lang() -> str:
+    """WAGSTAFF_LANG, resolved once per process (CLI runs are short-lived)."""
+    return _normalize_lang(os.environ.get("WAGSTAFF_LANG") or "")
+
+
+@lru_cache(maxsize=32)
+def _normalize_lang(value: str) -> str:
+    raw = value.strip().lower().replace("_", "-")
     if raw in LANG_ALIASES:
         raw = LANG_ALIASES[raw]
     return raw if raw in TEXTS else DEFAULT_LANG
 
 
+@lru_cache(maxsize=1024)
 def t(key: str, lang: str, default: Optional[str] = None) -> str:
     if not lang:
         lang = DEFAULT_LANG
@@ -25,11 +25,24 @@ def _tool_path(tool: dict) -> Path:
     return base / str(tool.get("file"))
 
 
+def _tool_module(path: Path) -> Optional[str]:
+    """Dotted module name for *path* if every folder up to PROJECT_ROOT is a package."""
+    try:
+        rel = path.relative_to(PROJECT_ROOT).with_suffix("")
+    except ValueError:
+        return None
+    pkg = PROJECT_ROOT
+    for part in rel.parts[:-1]:
+        pkg = pkg / part
+        if not (pkg / "__init__.py").is_file():
+            return None
+    return ".".join(rel.parts)
+
+
 def _resolve_tool(alias: Optional[str]) -> Tuple[Path, List[str]]:
-    from apps.cli.registry import get_tools
+    from apps.cli.registry import get_tool
 
-    tools = get_tools()
-    dash = next((t for t in tools if t.get("alias") == "dash"), None)
+    dash = get_tool("dash")
     default_path = _tool_path(dash) if dash else (PROJECT_ROOT / "apps" / "cli" / "commands" / "dash.py")
 
     if not alias:
@@ -39,9 +52,9 @@ def _resolve_tool(alias: Optional[str]) -> Tuple[Path, List[str]]:
     if not key:
         return default_path, []
 
-    for tool in tools:
-        if tool.get("alias") == key or tool.get("file") == key:
-            return _tool_path(tool), []
+    tool = get_tool(key)
+    if tool:
+        return _tool_path(tool), []
 
     # fallback: show dashboard, pass through as arg to help locate typos
     return default_path, [key]
@@ -57,7 +70,13 @@ def main(argv: Optional[List[str]] = None) -> None:
     argv = injected + argv
 
     sys.argv = [str(path)] + argv
-    runpy.run_path(str(path), run_name="__main__")
+    # run_module goes through the import system, so the tool's cached .pyc is
+    # used instead of recompiling the source on every invocation.
+    module = _tool_module(path)
+    if module and path.is_file():
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    else:
+        runpy.run_path(str(path), run_name="__main__")
 
 
 if __name__ == "__main__":
@@ -4,10 +4,14 @@
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+_TASK_RE = re.compile(r"\s*-\s*\*\*(T-\d+)\*\*[：:]?\s*(.+)$")
+_MILESTONE_RE = re.compile(r"\s*-\s*\*\*(M[0-9.]+)\s+([^*]+)\*\*（?([^）)]*)")
 
 
 @dataclass
@@ -30,21 +34,30 @@ def read_text(path: Path) -> str:
         return ""
 
 
+def _line_find(text: str, needle: str, pos: int) -> int:
+    """Index of the first *needle* at or after *pos* that starts a line, else -1."""
+    if text.startswith(needle, pos) and (pos == 0 or text[pos - 1] == "\n"):
+        return pos
+    i = text.find("\n" + needle, pos)
+    return -1 if i == -1 else i + 1
+
+
 def extract_section(text: str, heading_prefix: str) -> str:
-    lines = text.splitlines()
-    out: List[str] = []
-    in_section = False
-    for line in lines:
-        if line.startswith(heading_prefix):
-            if in_section:
-                break
-            in_section = True
-            continue
-        if in_section and line.startswith("## "):
-            break
-        if in_section:
-            out.append(line)
-    return "\n".join(out)
+    """Body of the first section whose heading line starts with *heading_prefix*.
+
+    The body runs to the next line starting with `## ` or *heading_prefix*.
+    """
+    head = _line_find(text, heading_prefix, 0)
+    if head == -1:
+        return ""
+    nl = text.find("\n", head)
+    start = len(text) if nl == -1 else nl + 1
+    end = len(text)
+    for stop in ("## ", heading_prefix):
+        pos = _line_find(text, stop, start)
+        if pos != -1 and pos < end:
+            end = pos
+    return "\n".join(text[start:end].splitlines())
 
 
 def normalize_status(raw: str) -> str:
@@ -63,8 +76,13 @@ def normalize_status(raw: str) -> str:
 def parse_tasks(text: str) -> List[Task]:
     section = extract_section(text, "## 4.")
     tasks: List[Task] = []
+    match = _TASK_RE.match
     for line in section.splitlines():
-        m = re.match(r"\s*-\s*\*\*(T-\d+)\*\*[：:]?\s*(.+)$", line.strip())
+        # "**T-" is required by the pattern; skip the regex on lines that lack it.
+        if "**T-" not in line:
+            continue
+        # `(.+)$` must not match trailing whitespace alone; the leading `\s*` covers the left side.
+        m = match(line.rstrip())
         if not m:
             continue
         key = m.group(1).strip()
@@ -76,8 +94,11 @@ def parse_tasks(text: str) -> List[Task]:
 def parse_milestones(text: str) -> List[Milestone]:
     section = extract_section(text, "## 2.")
     out: List[Milestone] = []
+    match = _MILESTONE_RE.match
     for line in section.splitlines():
-        m = re.match(r"\s*-\s*\*\*(M[0-9.]+)\s+([^*]+)\*\*（?([^）)]*)", line.strip())
+        if "**M" not in line:
+            continue
+        m = match(line)
         if not m:
             continue
         key = m.group(1).strip()
@@ -85,3 +106,28 @@ def parse_milestones(text: str) -> List[Milestone]:
         status = normalize_status(m.group(3).strip())
         out.append(Milestone(key=key, title=title, status=status))
     return out
+
+
+_MGMT_CACHE: Dict[Tuple[str, int, int], Tuple[List[Task], List[Milestone]]] = {}
+
+
+def load_mgmt(path: Path) -> Optional[Tuple[List[Task], List[Milestone]]]:
+    """Read + parse a management doc once per (path, mtime_ns, size); None if missing/empty.
+
+    The returned lists are shared between callers; copy them before mutating.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _MGMT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    text = read_text(path)
+    if not text:
+        return None
+    parsed = (parse_tasks(text), parse_milestones(text))
+    _MGMT_CACHE.clear()
+    _MGMT_CACHE[key] = parsed
+    return parsed
@@ -215,5 +215,14 @@ TOOLS = [
     },
 ]
 
+_ALIAS_INDEX = {t["alias"]: t for t in TOOLS if t.get("alias")}
+_FILE_INDEX = {t["file"]: t for t in TOOLS}
+
+
 def get_tools():
     return TOOLS
+
+
+def get_tool(key):
+    """Tool entry by alias (or by file name), or None."""
+    return _ALIAS_INDEX.get(key) or _FILE_INDEX.get(key)
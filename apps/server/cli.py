@@ -5,10 +5,11 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
-from apps.server.config import DEFAULT_CONFIG_PATH, resolve_config
+from apps.server.config import DEFAULT_CONFIG_PATH, ServerConfig, resolve_config
 from apps.server import manager
 from apps.server.ui import run_ui
 
@@ -22,57 +23,101 @@ def _add_common_flags(p: argparse.ArgumentParser) -> None:
     p.add_argument("--klei-home", default=None)
 
 
-def main(argv: Optional[Iterable[str]] = None) -> int:
+def _build_start(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--no-caves", action="store_true", help="Start Master only")
+
+
+def _build_stop(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--timeout", type=float, default=40.0)
+    p.add_argument("--force", action="store_true", help="Kill screen sessions if graceful stop times out")
+
+
+def _build_restart(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--no-caves", action="store_true")
+    p.add_argument("--update", action="store_true")
+
+
+def _build_backup(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--out", default=None, help="Output tar.gz path")
+
+
+def _build_restore(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--file", default=None, help="Backup tar.gz path")
+    p.add_argument("--index", type=int, default=None, help="Backup index (newest=0)")
+    p.add_argument("--latest", action="store_true")
+    p.add_argument("--yes", action="store_true", help="Confirm destructive overwrite")
+    p.add_argument("--start", action="store_true", help="Start after restore")
+
+
+def _build_logs(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--shard", choices=["master", "caves"], default="master")
+    p.add_argument("--follow", action="store_true")
+    p.add_argument("--lines", type=int, default=120)
+
+
+def _build_cmd(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--shard", choices=["master", "caves"], default="master")
+    p.add_argument("cmd", help="Console command to send")
+
+
+# action -> (help, extra-flag builder); order is the order shown in --help.
+_BUILDERS: Dict[str, Tuple[str, Optional[Callable[[argparse.ArgumentParser], None]]]] = {
+    "status": ("Show server status", None),
+    "start": ("Start server", _build_start),
+    "stop": ("Stop server", _build_stop),
+    "restart": ("Restart server", _build_restart),
+    "update": ("Update DST via SteamCMD", None),
+    "backup": ("Create backup tar.gz", _build_backup),
+    "restore": ("Restore from backup", _build_restore),
+    "logs": ("Tail server logs", _build_logs),
+    "cmd": ("Send console command", _build_cmd),
+    "ui": ("Interactive server menu", None),
+}
+
+
+def _build_parser(action: Optional[str]) -> argparse.ArgumentParser:
+    """Build the parser; when *action* is known only its subparser is constructed."""
     parser = argparse.ArgumentParser(description="DST server management (screen-based)")
     sub = parser.add_subparsers(dest="action", required=True)
+    names = [action] if action in _BUILDERS else list(_BUILDERS)
+    for name in names:
+        help_text, build = _BUILDERS[name]
+        p = sub.add_parser(name, help=help_text)
+        _add_common_flags(p)
+        if build is not None:
+            build(p)
+    return parser
+
+
+def _restore(args: argparse.Namespace, cfg: ServerConfig) -> int:
+    return manager.restore(
+        cfg,
+        file_path=Path(args.file) if args.file else None,
+        index=args.index,
+        latest=args.latest,
+        yes=args.yes,
+        start_after=args.start,
+    )
 
-    p_status = sub.add_parser("status", help="Show server status")
-    _add_common_flags(p_status)
-
-    p_start = sub.add_parser("start", help="Start server")
-    _add_common_flags(p_start)
-    p_start.add_argument("--no-caves", action="store_true", help="Start Master only")
-
-    p_stop = sub.add_parser("stop", help="Stop server")
-    _add_common_flags(p_stop)
-    p_stop.add_argument("--timeout", type=float, default=40.0)
-    p_stop.add_argument("--force", action="store_true", help="Kill screen sessions if graceful stop times out")
-
-    p_restart = sub.add_parser("restart", help="Restart server")
-    _add_common_flags(p_restart)
-    p_restart.add_argument("--no-caves", action="store_true")
-    p_restart.add_argument("--update", action="store_true")
-
-    p_update = sub.add_parser("update", help="Update DST via SteamCMD")
-    _add_common_flags(p_update)
-
-    p_backup = sub.add_parser("backup", help="Create backup tar.gz")
-    _add_common_flags(p_backup)
-    p_backup.add_argument("--out", default=None, help="Output tar.gz path")
-
-    p_restore = sub.add_parser("restore", help="Restore from backup")
-    _add_common_flags(p_restore)
-    p_restore.add_argument("--file", default=None, help="Backup tar.gz path")
-    p_restore.add_argument("--index", type=int, default=None, help="Backup index (newest=0)")
-    p_restore.add_argument("--latest", action="store_true")
-    p_restore.add_argument("--yes", action="store_true", help="Confirm destructive overwrite")
-    p_restore.add_argument("--start", action="store_true", help="Start after restore")
-
-    p_logs = sub.add_parser("logs", help="Tail server logs")
-    _add_common_flags(p_logs)
-    p_logs.add_argument("--shard", choices=["master", "caves"], default="master")
-    p_logs.add_argument("--follow", action="store_true")
-    p_logs.add_argument("--lines", type=int, default=120)
-
-    p_cmd = sub.add_parser("cmd", help="Send console command")
-    _add_common_flags(p_cmd)
-    p_cmd.add_argument("--shard", choices=["master", "caves"], default="master")
-    p_cmd.add_argument("cmd", help="Console command to send")
-
-    p_ui = sub.add_parser("ui", help="Interactive server menu")
-    _add_common_flags(p_ui)
-
-    args = parser.parse_args(list(argv) if argv is not None else None)
+
+_ACTIONS: Dict[str, Callable[[argparse.Namespace, ServerConfig], int]] = {
+    "status": lambda a, c: manager.status(c),
+    "start": lambda a, c: manager.start(c, start_caves=not a.no_caves),
+    "stop": lambda a, c: manager.stop(c, timeout=a.timeout, force=a.force),
+    "restart": lambda a, c: manager.restart(c, start_caves=not a.no_caves, update=a.update),
+    "update": lambda a, c: manager.update_game(c),
+    "backup": lambda a, c: manager.backup(c, out_path=Path(a.out) if a.out else None),
+    "restore": _restore,
+    "logs": lambda a, c: manager.logs(c, shard=a.shard, follow=a.follow, lines=a.lines),
+    "cmd": lambda a, c: manager.send_cmd(c, shard=a.shard, command=a.cmd),
+    "ui": lambda a, c: run_ui(c),
+}
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    argv = list(argv) if argv is not None else sys.argv[1:]
+    parser = _build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
     cfg = resolve_config(
         config_path=Path(args.config),
         dst_root=args.dst_root,
@@ -81,37 +126,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         cluster_name=args.cluster_name,
         klei_home=args.klei_home,
     )
-
-    if args.action == "status":
-        return manager.status(cfg)
-    if args.action == "start":
-        return manager.start(cfg, start_caves=not args.no_caves)
-    if args.action == "stop":
-        return manager.stop(cfg, timeout=args.timeout, force=args.force)
-    if args.action == "restart":
-        return manager.restart(cfg, start_caves=not args.no_caves, update=args.update)
-    if args.action == "update":
-        return manager.update_game(cfg)
-    if args.action == "backup":
-        out = Path(args.out) if args.out else None
-        return manager.backup(cfg, out_path=out)
-    if args.action == "restore":
-        return manager.restore(
-            cfg,
-            file_path=Path(args.file) if args.file else None,
-            index=args.index,
-            latest=args.latest,
-            yes=args.yes,
-            start_after=args.start,
-        )
-    if args.action == "logs":
-        return manager.logs(cfg, shard=args.shard, follow=args.follow, lines=args.lines)
-    if args.action == "cmd":
-        return manager.send_cmd(cfg, shard=args.shard, command=args.cmd)
-    if args.action == "ui":
-        return run_ui(cfg)
-
-    return 0
+    return _ACTIONS[args.action](args, cfg)
 
 
 if __name__ == "__main__":
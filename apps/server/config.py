@@ -7,8 +7,9 @@ from __future__ import annotations
 import configparser
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -23,19 +24,19 @@ class ServerConfig:
     cluster_name: str
     klei_home: Path
 
-    @property
+    @cached_property
     def bin_dir(self) -> Path:
         return self.dst_root / "bin"
 
-    @property
+    @cached_property
     def cluster_dir(self) -> Path:
         return self.klei_home / self.cluster_name
 
-    @property
+    @cached_property
     def master_log(self) -> Path:
         return self.cluster_dir / "Master" / "server_log.txt"
 
-    @property
+    @cached_property
     def caves_log(self) -> Path:
         return self.cluster_dir / "Caves" / "server_log.txt"
 
@@ -54,11 +55,22 @@ def _cfg_get(cfg: configparser.ConfigParser, section: str, key: str) -> Optional
     return _expand(val) if val else None
 
 
+_CFG_CACHE: Dict[Tuple[str, int, int], configparser.ConfigParser] = {}
+
+
 def load_ini(path: Path) -> configparser.ConfigParser:
-    cfg = configparser.ConfigParser()
-    if not path.exists():
+    """Parsed INI, cached by (path, mtime_ns, size); treat the result as read-only."""
+    try:
+        st = os.stat(path)
+    except OSError:
         raise SystemExit(f"Missing config: {path}")
-    cfg.read(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cfg = _CFG_CACHE.get(key)
+    if cfg is None:
+        cfg = configparser.ConfigParser()
+        cfg.read(path)
+        _CFG_CACHE.clear()
+        _CFG_CACHE[key] = cfg
     return cfg
 
 
@@ -5,37 +5,93 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import subprocess
+import sys
 import tarfile
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from apps.server.config import ServerConfig
 
+_TAR_BUFSIZE = 64 * 1024
+# Per-member data copy chunk; large save files then move in a few big reads/writes.
+_TAR_COPYBUFSIZE = 1 << 20
+_TAIL_BLOCK = 64 * 1024
+_SHARDS = ("DST_Master", "DST_Caves")
+
+
+_SCREEN_PATH: Optional[str] = None
+
+
+def _screen_path() -> Optional[str]:
+    """`shutil.which("screen")`, kept once found; a miss is retried on the next call."""
+    global _SCREEN_PATH
+    if _SCREEN_PATH is None:
+        _SCREEN_PATH = shutil.which("screen")
+    return _SCREEN_PATH
+
+
+def _screen() -> str:
+    return _screen_path() or "screen"
+
 
 def _require_screen() -> None:
-    if not shutil.which("screen"):
+    if not _screen_path():
         raise SystemExit("screen not found (install screen to manage DST sessions).")
 
 
 def _screen_list() -> str:
-    r = subprocess.run(["screen", "-ls"], capture_output=True, text=True)
+    r = subprocess.run([_screen(), "-ls"], capture_output=True, text=True)
     return r.stdout or ""
 
 
-def _screen_has(name: str) -> bool:
-    return name in _screen_list()
+def _screen_has(name: str, snapshot: Optional[str] = None) -> bool:
+    """Whether session *name* is listed; pass a `_screen_list()` snapshot to reuse one `screen -ls`."""
+    if snapshot is None:
+        snapshot = _screen_list()
+    return name in snapshot
+
+
+def _any_running(snapshot: str) -> bool:
+    return any(_screen_has(shard, snapshot) for shard in _SHARDS)
+
+
+def _stuff_argv(name: str, cmd: str) -> list[str]:
+    return [_screen(), "-S", name, "-p", "0", "-X", "stuff", f"{cmd}\015"]
+
+
+def _quit_argv(name: str) -> list[str]:
+    return [_screen(), "-S", name, "-X", "quit"]
 
 
 def _send_screen_cmd(name: str, cmd: str) -> None:
-    subprocess.run(["screen", "-S", name, "-p", "0", "-X", "stuff", f"{cmd}\015"], check=False)
+    subprocess.run(_stuff_argv(name, cmd), check=False)
 
 
-def _quit_screen(name: str) -> None:
-    subprocess.run(["screen", "-S", name, "-X", "quit"], check=False)
+def _run_all(argvs: list[list[str]], **popen_kwargs: Any) -> None:
+    """Start independent short-lived commands together, then wait for all of them.
+
+    Every process that did start is waited on, even if a later launch raises.
+    """
+    procs: list[subprocess.Popen] = []
+    try:
+        for argv in argvs:
+            procs.append(subprocess.Popen(argv, **popen_kwargs))
+    finally:
+        for proc in procs:
+            proc.wait()
+
+
+def _backoff(start: float = 0.05, cap: float = 1.0, factor: float = 1.5) -> Iterator[float]:
+    """Poll intervals: quick checks first (fast shutdowns), then back off to *cap*."""
+    delay = start
+    while True:
+        yield delay
+        delay = min(cap, delay * factor)
 
 
 def _dst_env(cfg: ServerConfig) -> dict:
@@ -55,14 +111,13 @@ def status(cfg: ServerConfig) -> int:
 
 def get_status(cfg: ServerConfig) -> tuple[bool, bool]:
     _require_screen()
-    master = _screen_has("DST_Master")
-    caves = _screen_has("DST_Caves")
-    return master, caves
+    snap = _screen_list()
+    return _screen_has("DST_Master", snap), _screen_has("DST_Caves", snap)
 
 
 def start(cfg: ServerConfig, *, start_caves: bool = True) -> int:
     _require_screen()
-    if _screen_has("DST_Master") or _screen_has("DST_Caves"):
+    if _any_running(_screen_list()):
         print("Server already running.")
         return 1
 
@@ -71,47 +126,43 @@ def start(cfg: ServerConfig, *, start_caves: bool = True) -> int:
     if not exe.exists():
         raise SystemExit(f"Missing server binary: {exe}")
 
-    env = _dst_env(cfg)
-    subprocess.run(
-        ["screen", "-dmS", "DST_Master", "./dontstarve_dedicated_server_nullrenderer", "-console", "-cluster", cfg.cluster_name, "-shard", "Master"],
+    shards = ["Master", "Caves"] if start_caves else ["Master"]
+    # `screen -dmS` detaches right away, so both shards are launched together.
+    _run_all(
+        [
+            [_screen(), "-dmS", f"DST_{shard}", "./dontstarve_dedicated_server_nullrenderer", "-console", "-cluster", cfg.cluster_name, "-shard", shard]
+            for shard in shards
+        ],
         cwd=bin_dir,
-        env=env,
-        check=False,
+        env=_dst_env(cfg),
     )
-    print("Master started.")
-
-    if start_caves:
-        subprocess.run(
-            ["screen", "-dmS", "DST_Caves", "./dontstarve_dedicated_server_nullrenderer", "-console", "-cluster", cfg.cluster_name, "-shard", "Caves"],
-            cwd=bin_dir,
-            env=env,
-            check=False,
-        )
-        print("Caves started.")
+    for shard in shards:
+        print(f"{shard} started.")
     return 0
 
 
 def stop(cfg: ServerConfig, *, timeout: float = 40.0, force: bool = False) -> int:
     _require_screen()
-    if not (_screen_has("DST_Master") or _screen_has("DST_Caves")):
+    snap = _screen_list()
+    if not _any_running(snap):
         print("Server not running.")
         return 1
 
-    for shard in ("DST_Master", "DST_Caves"):
-        if _screen_has(shard):
-            _send_screen_cmd(shard, "c_shutdown(true)")
+    _run_all([_stuff_argv(shard, "c_shutdown(true)") for shard in _SHARDS if _screen_has(shard, snap)])
 
     end_at = time.time() + timeout
-    while time.time() < end_at:
-        if not (_screen_has("DST_Master") or _screen_has("DST_Caves")):
+    for delay in _backoff():
+        if not _any_running(_screen_list()):
             print("Server stopped.")
             return 0
-        time.sleep(0.5)
+        remaining = end_at - time.time()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
 
     if force:
-        for shard in ("DST_Master", "DST_Caves"):
-            if _screen_has(shard):
-                _quit_screen(shard)
+        snap = _screen_list()
+        _run_all([_quit_argv(shard) for shard in _SHARDS if _screen_has(shard, snap)])
         print("Server force-stopped.")
         return 0
 
@@ -151,6 +202,78 @@ def update_game(cfg: ServerConfig) -> int:
     return 0
 
 
+def _write_tarball(src: Path, arcname: str, out_path: Path) -> None:
+    """tar.gz *src* into *out_path*, compressing on all cores with pigz when it is installed.
+
+    The archive is written under a hidden per-process name and moved into place only
+    once complete, so a failed backup never leaves a truncated `*.tar.gz` behind.
+    """
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.part")
+    pigz = shutil.which("pigz")
+    try:
+        if not pigz:
+            # gzip level 6 (gzip's own default) instead of tarfile's 9: much less CPU for ~1% more size.
+            with tarfile.open(tmp, "w:gz", compresslevel=6, copybufsize=_TAR_COPYBUFSIZE) as tar:
+                tar.add(src, arcname=arcname)
+        else:
+            _pigz_tarball(pigz, src, arcname, tmp, out_path)
+        os.replace(tmp, out_path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _pigz_tarball(pigz: str, src: Path, arcname: str, tmp: Path, out_path: Path) -> None:
+    broken: Optional[BrokenPipeError] = None
+    with open(tmp, "wb") as out:
+        proc = subprocess.Popen([pigz, "-6", "-c"], stdin=subprocess.PIPE, stdout=out)
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|", bufsize=_TAR_BUFSIZE, copybufsize=_TAR_COPYBUFSIZE) as tar:
+                tar.add(src, arcname=arcname)
+        except BrokenPipeError as e:
+            broken = e  # pigz went away; its exit code below says why
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            rc = proc.wait()
+    if rc != 0:
+        raise SystemExit(f"pigz failed (exit {rc}) while writing {out_path}")
+    if broken is not None:
+        raise broken
+
+
+def _extractall(tar: tarfile.TarFile, dest: Path) -> None:
+    # The "data" filter (3.12+ and security backports) rejects absolute paths and links
+    # escaping *dest*, and avoids the 3.12+ DeprecationWarning for unfiltered extraction.
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(dest, filter="data")
+    else:
+        tar.extractall(dest)
+
+
+def _extract_tarball(archive: Path, dest: Path) -> None:
+    """Unpack a tar.gz into *dest*, decompressing with pigz when it is installed."""
+    pigz = shutil.which("pigz")
+    if not pigz:
+        with tarfile.open(archive, "r:gz", copybufsize=_TAR_COPYBUFSIZE) as tar:
+            _extractall(tar, dest)
+        return
+    proc = subprocess.Popen([pigz, "-dc", str(archive)], stdout=subprocess.PIPE)
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|", bufsize=_TAR_BUFSIZE, copybufsize=_TAR_COPYBUFSIZE) as tar:
+            _extractall(tar, dest)
+    finally:
+        proc.stdout.close()
+        rc = proc.wait()
+    if rc != 0:
+        raise SystemExit(f"pigz failed (exit {rc}) while reading {archive}")
+
+
 def backup(cfg: ServerConfig, *, out_path: Optional[Path] = None) -> int:
     cfg.backup_dir.mkdir(parents=True, exist_ok=True)
     if not cfg.cluster_dir.exists():
@@ -160,8 +283,7 @@ def backup(cfg: ServerConfig, *, out_path: Optional[Path] = None) -> int:
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         out_path = cfg.backup_dir / f"backup_{stamp}.tar.gz"
 
-    with tarfile.open(out_path, "w:gz") as tar:
-        tar.add(cfg.cluster_dir, arcname=cfg.cluster_name)
+    _write_tarball(cfg.cluster_dir, cfg.cluster_name, out_path)
     print(f"Backup created: {out_path}")
     return 0
 
@@ -178,11 +300,39 @@ def _safe_delete_cluster(cfg: ServerConfig) -> None:
     shutil.rmtree(target)
 
 
+_BACKUP_NAME_RE = re.compile(r"backup_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.tar\.gz")
+
+
+def _backup_time(entry: os.DirEntry) -> float:
+    """Creation time from a `backup_YYYYMMDD_HHMMSS.tar.gz` name; other archives fall back to mtime."""
+    m = _BACKUP_NAME_RE.fullmatch(entry.name)
+    if m:
+        return time.mktime(tuple(map(int, m.groups())) + (0, 0, -1))
+    return entry.stat().st_mtime
+
+
+_BACKUPS_CACHE: Dict[Tuple[str, int], list[Path]] = {}
+
+
 def _list_backups(cfg: ServerConfig) -> list[Path]:
-    if not cfg.backup_dir.exists():
+    """Backups newest first, cached by the directory's (path, mtime_ns).
+
+    Adding or removing an archive bumps the directory mtime, which invalidates the entry.
+    """
+    try:
+        st = os.stat(cfg.backup_dir)
+    except OSError:
         return []
-    backups = sorted(cfg.backup_dir.glob("*.tar.gz"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return backups
+    key = (str(cfg.backup_dir), st.st_mtime_ns)
+    cached = _BACKUPS_CACHE.get(key)
+    if cached is None:
+        with os.scandir(cfg.backup_dir) as it:
+            stamped = [(_backup_time(e), e.name) for e in it if e.name.endswith(".tar.gz")]
+        stamped.sort(reverse=True)
+        cached = [cfg.backup_dir / name for _, name in stamped]
+        _BACKUPS_CACHE.clear()
+        _BACKUPS_CACHE[key] = cached
+    return list(cached)
 
 
 def list_backups(cfg: ServerConfig) -> list[Path]:
@@ -219,14 +369,13 @@ def restore(
     if not yes:
         raise SystemExit("Restore requires --yes to confirm destructive overwrite.")
 
-    if _screen_has("DST_Master") or _screen_has("DST_Caves"):
+    if _any_running(_screen_list()):
         stop(cfg, timeout=40.0, force=True)
 
     if cfg.cluster_dir.exists():
         _safe_delete_cluster(cfg)
 
-    with tarfile.open(chosen, "r:gz") as tar:
-        tar.extractall(cfg.klei_home)
+    _extract_tarball(chosen, cfg.klei_home)
     print(f"Restore completed: {chosen}")
 
     if start_after:
@@ -234,14 +383,41 @@ def restore(
     return 0
 
 
+def _tail_lines(path: Path, n: int) -> bytes:
+    """Last *n* lines of *path* (same output as `tail -n`), reading blocks backward from the end."""
+    if n <= 0:
+        return b""
+    chunks = []
+    newlines = 0
+    with open(path, "rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= n:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    # A trailing newline ends the last line; it does not start another one.
+    end = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(n):
+        end = data.rfind(b"\n", 0, end)
+        if end == -1:
+            return data
+    return data[end + 1:]
+
+
 def logs(cfg: ServerConfig, *, shard: str = "master", follow: bool = False, lines: int = 120) -> int:
     log_path = cfg.master_log if shard == "master" else cfg.caves_log
     if not log_path.exists():
         raise SystemExit(f"Log not found: {log_path}")
-    cmd = ["tail", "-n", str(lines), str(log_path)]
     if follow:
-        cmd = ["tail", "-f", "-n", str(lines), str(log_path)]
-    subprocess.run(cmd, check=False)
+        subprocess.run(["tail", "-f", "-n", str(lines), str(log_path)], check=False)
+        return 0
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_tail_lines(log_path, abs(lines)))
+    sys.stdout.buffer.flush()
     return 0
 
 
@@ -524,6 +524,10 @@ def _parse_filter_bindings_by_calls(src: str) -> Dict[str, List[str]]:
 # =========================================================
 
 
+def _normalize_inventory(inventory: Optional[Mapping[str, float]]) -> Dict[str, float]:
+    return {str(k).lower(): float(v) for k, v in (inventory or {}).items()}
+
+
 class CraftRecipeDB:
     """Queryable craft recipe database.
 
@@ -685,6 +689,10 @@ class CraftRecipeDB:
             return None, None
         return canonical, self.recipes.get(canonical)
 
+    def get_raw(self, name: str) -> Optional[Dict[str, Any]]:
+        """Exact canonical-name lookup (no alias resolution), for names from list_* results."""
+        return self.recipes.get(name)
+
     def list_tabs(self) -> List[str]:
         return list(self.tab_order)
 
@@ -733,9 +741,11 @@ class CraftRecipeDB:
         _, rec = self.get(recipe_name)
         if not rec:
             return []
+        return self._missing(rec, _normalize_inventory(inventory))
 
-        inv = {str(k).lower(): float(v) for k, v in (inventory or {}).items()}
-
+    @staticmethod
+    def _missing(rec: Mapping[str, Any], inv: Mapping[str, float]) -> List[Dict[str, Any]]:
+        """missing_for() core over an already-normalized (lower-cased, float) inventory."""
         missing: List[Dict[str, Any]] = []
         for ing in rec.get("ingredients") or []:
             item = str(ing.get("item") or "").lower()
@@ -766,7 +776,7 @@ class CraftRecipeDB:
         - builder_tag: if set, only recipes that are not character-locked or match builder_tag.
         - strict: if True, recipes with unresolved ingredient amounts are excluded.
         """
-        inv = {str(k).lower(): float(v) for k, v in (inventory or {}).items()}
+        inv = _normalize_inventory(inventory)
         bt = builder_tag.strip().lower() if builder_tag else None
 
         out: List[str] = []
@@ -777,7 +787,7 @@ class CraftRecipeDB:
                 if tags and bt not in tags:
                     continue
 
-            miss = self.missing_for(name, inv)
+            miss = self._missing(rec, inv)
             if not miss:
                 out.append(name)
             else:
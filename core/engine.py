@@ -21,11 +21,13 @@ Design notes
 from __future__ import annotations
 
 import logging
+import mmap
 import os
+import re
 import zipfile
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 # Optional project config (exists in repo under core/config/loader.py)
 try:
@@ -44,6 +46,11 @@ from core.craft_recipes import CraftRecipeDB
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_LOOT_TABLE_PREFIX = b"SetSharedLootTable"
+_LOOT_TABLE_RE = re.compile(rb"SetSharedLootTable\s*\(\s*['\"]([^'\"]*)['\"]")
+
 
 def _expanduser(p: Optional[str]) -> Optional[str]:
     return os.path.expanduser(p) if p else None
@@ -133,9 +140,12 @@ class WagstaffEngine:
         self.mode: str = ""  # 'zip' | 'folder'
         self.source: object = None  # ZipFile or folder path (str)
         self.file_list: List[str] = []
+        self.lua_files: List[str] = []  # file_list filtered to *.lua, same order
 
         # basename index for fast fuzzy find
         self._basename_index: Dict[str, List[str]] = {}
+        # SetSharedLootTable name -> defining file (built on first use)
+        self._loot_index: Optional[Dict[str, str]] = None
 
         self.tuning: Optional[TuningResolver] = None
         self.recipes: Optional[CraftRecipeDB] = None
@@ -148,6 +158,7 @@ class WagstaffEngine:
             scripts_dir=scripts_dir,
             prefer_local_bundles=prefer_local_bundles,
         )
+        self.lua_files = [p for p in self.file_list if p.endswith(".lua")]
         self._build_basename_index()
 
         if load_db:
@@ -281,9 +292,7 @@ class WagstaffEngine:
 
     def _build_basename_index(self) -> None:
         mp: Dict[str, List[str]] = {}
-        for p in self.file_list:
-            if not p.endswith(".lua"):
-                continue
+        for p in self.lua_files:
             base = os.path.basename(p)
             key = base.replace(".lua", "").replace("_", "").lower()
             mp.setdefault(key, []).append(p)
@@ -332,6 +341,46 @@ class WagstaffEngine:
 
         return None
 
+    def _scan_raw(self, path: str, fn: Callable[[Any], _T], default: _T) -> _T:
+        """Apply *fn* to the raw bytes of *path* (an mmap for folder sources).
+
+        Nothing is decoded or cached; returns *default* if the file is missing or
+        unreadable. *fn* must not keep references to its argument.
+        """
+        candidates = self._normalize_path_candidates(path)
+        try:
+            if self.mode == "zip":
+                zf: zipfile.ZipFile = self.source  # type: ignore[assignment]
+                for p in candidates:
+                    try:
+                        data = zf.read(p)
+                    except KeyError:
+                        continue
+                    return fn(data)
+                return default
+
+            base: str = self.source  # type: ignore[assignment]
+            for p in candidates:
+                real = os.path.join(base, p.replace("scripts/", "", 1))
+                if os.path.isfile(real):
+                    with open(real, "rb") as f:
+                        if os.fstat(f.fileno()).st_size == 0:
+                            return fn(b"")
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            return fn(mm)
+        except Exception:
+            return default
+
+        return default
+
+    def file_contains(self, path: str, needle: bytes) -> bool:
+        """Raw byte substring probe for *path* in the mounted source.
+
+        Unlike `read_file()` this neither decodes nor caches the content, so a
+        full-tree scan stays cheap (folder files are searched through mmap).
+        """
+        return self._scan_raw(path, lambda buf: buf.find(needle) != -1, False)
+
     def find_file(self, name: str, fuzzy: bool = True) -> Optional[str]:
         """Find a file by short name.
 
@@ -378,15 +427,47 @@ class WagstaffEngine:
 
         # final fallback: scan
         target = key
-        for fname in self.file_list:
-            if not fname.endswith(".lua"):
-                continue
+        for fname in self.lua_files:
             b = os.path.basename(fname).replace(".lua", "").replace("_", "").lower()
             if b == target:
                 return fname
 
         return None
 
+    def _loot_table_names(self, buf) -> List[str]:
+        start = buf.find(_LOOT_TABLE_PREFIX)
+        if start == -1:
+            return []
+        return [m.group(1).decode(self.encoding, errors="replace") for m in _LOOT_TABLE_RE.finditer(buf, start)]
+
+    def loot_table_index(self) -> Dict[str, str]:
+        """Map every `SetSharedLootTable("name", ...)` to its defining file.
+
+        Built with one raw-bytes pass over the .lua files on first call: the regex
+        only runs from the first `SetSharedLootTable` literal on, and nothing is
+        decoded except the captured names. The first definition in `file_list` wins.
+        """
+        if self._loot_index is None:
+            idx: Dict[str, str] = {}
+            for path in self.lua_files:
+                for name in self._scan_raw(path, self._loot_table_names, []):
+                    idx.setdefault(name, path)
+            self._loot_index = idx
+        return self._loot_index
+
+    def find_loot_table(self, name: str) -> Optional[str]:
+        """File defining loot table *name*, or None.
+
+        Served from `loot_table_index()` once it has been built; otherwise the
+        .lua files are probed in order and the scan stops at the first definition.
+        """
+        if self._loot_index is not None:
+            return self._loot_index.get(name)
+        for path in self.lua_files:
+            if self._scan_raw(path, lambda buf: name in self._loot_table_names(buf), False):
+                return path
+        return None
+
     def close(self) -> None:
         if self.mode == "zip" and self.source is not None:
             try:
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from core.lua import (
@@ -662,7 +663,11 @@ class CookingRecipeAnalyzer:
                     rows: List[List[Any]] = []
                     for r in ing.array:
                         if isinstance(r, LuaTableValue) and len(r.array) >= 2:
-                            rows.append([lua_to_python(r.array[0]), lua_to_python(r.array[1])])
+                            item = lua_to_python(r.array[0])
+                            if isinstance(item, str):
+                                # shared with inventory keys; interning makes dict probes identity hits
+                                item = sys.intern(item)
+                            rows.append([item, lua_to_python(r.array[1])])
                     if rows:
                         out["card_ingredients"] = rows
 